@@ -9,15 +9,24 @@ class HangmanGame:
     max_errors: int = 5
     guessed_letters: set[str] = field(default_factory=set)
     score: int = 0
+    _word_letters: frozenset[str] = field(init=False, repr=False, compare=False)
+    _trans: dict[int, str] = field(init=False, repr=False, compare=False)
+    _remaining: int = field(init=False, repr=False, compare=False)
+    _display: str = field(init=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:
         self.word = self.word.lower()
+        self._word_letters = frozenset(self.word)
+        self._trans = {
+            ord(letter): letter if letter in self.guessed_letters else "_"
+            for letter in self._word_letters
+        }
+        self._remaining = len(self._word_letters - self.guessed_letters)
+        self._refresh_display()
 
     @property
     def masked_word(self) -> str:
-        return " ".join(
-            letter if letter in self.guessed_letters else "_" for letter in self.word
-        )
+        return self._display
 
     def guess(self, letter: str) -> bool:
         letter = letter.lower()
@@ -27,15 +36,28 @@ class HangmanGame:
             return letter in self.word
 
         self.guessed_letters.add(letter)
-        if letter in self.word:
+        if letter in self._word_letters:
+            self._reveal(letter)
+            return True
+        if len(letter) > 1 and letter in self.word:
+            # A multi-letter guess found in the word counts as correct but
+            # reveals nothing; only single letters uncover positions.
             return True
 
         self.score += 1
         return False
 
+    def _reveal(self, letter: str) -> None:
+        self._trans[ord(letter)] = letter
+        self._remaining -= 1
+        self._refresh_display()
+
+    def _refresh_display(self) -> None:
+        self._display = " ".join(self.word.translate(self._trans))
+
     @property
     def is_won(self) -> bool:
-        return all(letter in self.guessed_letters for letter in set(self.word))
+        return self._remaining == 0
 
     @property
     def is_lost(self) -> bool:
@@ -49,3 +49,43 @@ def test_lose_when_score_reaches_5() -> None:
 
     assert game.status == "lost"
     assert game.score == 5
+
+
+def test_guess_reveals_every_occurrence_of_letter() -> None:
+    game = HangmanGame("papa")
+
+    game.guess("p")
+
+    assert game.masked_word == "p _ p _"
+    assert game.status == "ongoing"
+
+
+def test_initial_guessed_letters_are_revealed() -> None:
+    game = HangmanGame("chat", guessed_letters={"c", "h", "a"})
+
+    assert game.masked_word == "c h a _"
+
+    game.guess("t")
+
+    assert game.status == "won"
+
+
+def test_repeated_correct_guess_does_not_count_twice_towards_win() -> None:
+    game = HangmanGame("chat")
+
+    for letter in ["c", "c", "h", "h", "a"]:
+        game.guess(letter)
+
+    assert game.is_won is False
+    assert game.status == "ongoing"
+
+
+def test_guess_of_several_letters_in_word_is_correct_but_reveals_nothing() -> None:
+    game = HangmanGame("cab")
+
+    is_correct = game.guess("ab")
+
+    assert is_correct is True
+    assert game.score == 0
+    assert game.masked_word == "_ _ _"
+    assert game.status == "ongoing"